@@ -36,17 +36,18 @@ pygments_dark_style = "one-dark"
 
 html_theme = "furo"
 
-
-def entire_domain(host):
-    return r"http.?://" + re.escape(host) + r"($|/.*)"
-
+SHIELDS = rf"http.?://{re.escape('img.shields.io')}($|/.*)"
 
 linkcheck_ignore = [
-    entire_domain("img.shields.io"),
+    SHIELDS,
     f"{GITHUB}.*#.*",
     str(HOMEPAGE / "actions"),
     str(HOMEPAGE / "workflows/CI/badge.svg"),
 ]
+linkcheck_anchors = False
+linkcheck_retries = 2
+linkcheck_timeout = 5
+linkcheck_workers = 10
 
 # = Extensions =
 
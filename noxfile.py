@@ -1,6 +1,7 @@
 from pathlib import Path
 from tempfile import TemporaryDirectory
 import os
+import shutil
 
 import nox
 
@@ -8,6 +9,8 @@ ROOT = Path(__file__).parent
 TESTS = ROOT / "tests"
 PYPROJECT = ROOT / "pyproject.toml"
 DOCS = ROOT / "docs"
+SRC = ROOT / "src"
+CACHE = ROOT / ".nox-cache"
 
 REQUIREMENTS = dict(
     docs=DOCS / "requirements.txt",
@@ -17,6 +20,24 @@ REQUIREMENTS_IN = [  # this is actually ordered, as files depend on each other
     path.parent / f"{path.stem}.in" for path in REQUIREMENTS.values()
 ]
 
+# pytest options which need its cache plugin (or stepwise) left enabled
+USES_PYTEST_CACHE = {
+    "--lf",
+    "--last-failed",
+    "--ff",
+    "--failed-first",
+    "--lfnf",
+    "--last-failed-no-failures",
+    "--nf",
+    "--new-first",
+    "--sw",
+    "--stepwise",
+    "--sw-skip",
+    "--stepwise-skip",
+    "--cache-show",
+    "--cache-clear",
+}
+
 SUPPORTED = ["3.8", "3.9", "3.10", "3.11", "3.12", "pypy3.10"]
 LATEST = "3.12"
 
@@ -27,17 +48,57 @@ def session(default=True, python=LATEST, **kwargs):  # noqa: D103
     def _session(fn):
         if default:
             nox.options.sessions.append(kwargs.get("name", fn.__name__))
+        kwargs.setdefault("reuse_venv", True)
         return nox.session(python=python, **kwargs)(fn)
 
     return _session
 
 
+def _install_if_changed(session, *args, inputs):
+    """
+    Install into the session only if any of the inputs changed since last time.
+
+    Sessions without a virtualenv of their own (e.g. run with ``--no-venv``)
+    always install.
+    """
+    location = getattr(session.virtualenv, "location", None)
+    if location is None:
+        session.install(*args)
+        return
+
+    stamp = CACHE / "last-sync" / session.name
+    newest = max(
+        each.stat().st_mtime
+        for path in inputs
+        if path.exists()
+        for each in (path.rglob("*") if path.is_dir() else [path])
+    )
+    created = Path(location).stat().st_mtime
+    if stamp.exists() and stamp.stat().st_mtime >= max(newest, created):
+        return
+    session.install(*args)
+    stamp.parent.mkdir(parents=True, exist_ok=True)
+    stamp.touch()
+
+
 @session(python=SUPPORTED)
 def tests(session):
     """
     Run the test suite with a corresponding Python version.
     """
-    session.install("-r", REQUIREMENTS["tests"])
+    _install_if_changed(
+        session,
+        "-r",
+        REQUIREMENTS["tests"],
+        inputs=[
+            PYPROJECT,
+            ROOT / "Cargo.toml",
+            ROOT / "Cargo.lock",
+            ROOT / "rpds.pyi",
+            SRC,
+            REQUIREMENTS["tests"],
+        ],
+    )
 
     if session.posargs and session.posargs[0] == "coverage":
         if len(session.posargs) > 1 and session.posargs[1] == "github":
@@ -60,7 +121,13 @@ def tests(session):
                     stdout=summary,
                 )
     else:
-        session.run("pytest", *session.posargs, TESTS)
+        argv = ["--import-mode=importlib", "-n", "auto", "--dist=worksteal"]
+        if not any(
+            arg.partition("=")[0] in USES_PYTEST_CACHE
+            for arg in session.posargs
+        ):
+            argv = ["-p", "no:cacheprovider", *argv]
+        session.run("pytest", *argv, *session.posargs, TESTS)
 
 
 @session()
@@ -80,7 +147,8 @@ def build(session):
     session.install("build", "twine")
     with TemporaryDirectory() as tmpdir:
         session.run("python", "-m", "build", ROOT, "--outdir", tmpdir)
-        session.run("twine", "check", "--strict", tmpdir + "/*")
+        artifacts = sorted(Path(tmpdir).glob("*"))
+        session.run("twine", "check", "--strict", *artifacts)
 
 
 @session(tags=["style"])
@@ -109,14 +177,36 @@ def style(session):
 def docs(session, builder):
     """
     Build the documentation using a specific Sphinx builder.
+
+    Doctrees are cached in .nox-cache; pass --clean to discard them.
     """
     session.install("-r", REQUIREMENTS["docs"])
+
+    posargs = list(session.posargs)
+    clean = "--clean" in posargs
+    if clean:
+        posargs.remove("--clean")
+
     with TemporaryDirectory() as tmpdir_str:
         tmpdir = Path(tmpdir_str)
-        argv = ["-n", "-T", "-W"]
+        unfinished = None
+        if builder in {"linkcheck", "spelling"}:
+            doctrees = tmpdir / "doctrees"
+        else:
+            doctrees = CACHE / "doctrees" / builder
+            # Sphinx won't re-emit warnings for unchanged documents, so drop
+            # the cache if the last build didn't finish successfully.
+            unfinished = doctrees.with_suffix(".unfinished")
+            if clean or unfinished.exists():
+                shutil.rmtree(doctrees, ignore_errors=True)
+            unfinished.parent.mkdir(parents=True, exist_ok=True)
+            unfinished.touch()
+        argv = ["-n", "-T", "-W", "-d", doctrees]
+        if builder not in {"linkcheck", "spelling"}:
+            argv += ["-j", "auto"]
         if builder != "spelling":
             argv += ["-q"]
-        posargs = session.posargs or [tmpdir / builder]
+        posargs = posargs or [tmpdir / builder]
         session.run(
             "python",
             "-m",
@@ -127,6 +217,8 @@ def docs(session, builder):
             *argv,
             *posargs,
         )
+        if unfinished is not None:
+            unfinished.unlink()
 
 
 @session(tags=["docs", "style"], name="docs(style)")
@@ -28,6 +28,7 @@ Pre-modification, these were MIT licensed, and are copyright:
 """
 
 from collections import abc
+from itertools import islice
 from operator import methodcaller
 import pickle
 
@@ -36,6 +37,18 @@ import pytest
 from rpds import HashTrieMap
 
 HASH_MSG = "Not sure HashTrieMap implements Hash, it has mutable methods"
+NE_MSG = (
+    "!= on same-sized maps is only true if *every* value differs "
+    "(and is vacuously true for empty ones)"
+)
+
+_EMPTY = HashTrieMap()
+_AB = HashTrieMap(a=1, b=2)
+_ABC = HashTrieMap(a=1, b=2, c=3)
+
+_KEYS_2000 = list(map(str, range(2000)))
+
+_PICKLED_12_34 = pickle.dumps(HashTrieMap([(1, 2), (3, 4)]))
 
 
 @pytest.mark.xfail(reason=HASH_MSG)
@@ -48,8 +61,8 @@ def test_instance_of_map():
 
 
 def test_literalish_works():
-    assert HashTrieMap() == HashTrieMap()
-    assert HashTrieMap(a=1, b=2) == HashTrieMap({"a": 1, "b": 2})
+    assert _EMPTY == HashTrieMap()
+    assert _AB == HashTrieMap({"a": 1, "b": 2})
 
 
 def test_empty_initialization():
@@ -87,8 +100,8 @@ def test_remove_non_existing_element_raises_key_error():
 
 def test_various_iterations():
     assert {"a", "b"} == set(HashTrieMap(a=1, b=2))
-    assert ["a", "b"] == sorted(HashTrieMap(a=1, b=2).keys())
-    assert [1, 2] == sorted(HashTrieMap(a=1, b=2).values())
+    assert {"a", "b"} == set(HashTrieMap(a=1, b=2).keys())
+    assert {1, 2} == set(HashTrieMap(a=1, b=2).values())
     assert {("a", 1), ("b", 2)} == set(HashTrieMap(a=1, b=2).items())
 
     pm = HashTrieMap({k: k for k in range(100)})
@@ -115,9 +128,23 @@ def test_initialization_with_two_elements():
     assert map2["b"] == 3
 
 
-def test_initialization_with_many_elements():
-    init_dict = {str(x): x for x in range(1700)}
-    the_map = HashTrieMap(init_dict)
+@pytest.fixture(scope="session")
+def base_dict_2000():
+    return dict(zip(_KEYS_2000, range(2000)))
+
+
+@pytest.fixture(scope="session")
+def big_init_dict_1700(base_dict_2000):
+    return dict(islice(base_dict_2000.items(), 1700))
+
+
+@pytest.fixture(scope="session")
+def big_map_1700(big_init_dict_1700):
+    return HashTrieMap(big_init_dict_1700)
+
+
+def test_initialization_with_many_elements(big_map_1700):
+    the_map = big_map_1700
 
     assert len(the_map) == 1700
     assert the_map["16"] == 16
@@ -156,14 +183,18 @@ def test_overwrite_existing_element():
 
 @pytest.mark.xfail(reason=HASH_MSG)
 def test_hash():
-    x = HashTrieMap(a=1, b=2, c=3)
-    y = HashTrieMap(a=1, b=2, c=3)
+    assert hash(_ABC) == hash(HashTrieMap(a=1, b=2, c=3))
+
 
-    assert hash(x) == hash(y)
+@pytest.fixture(scope="session")
+def big_int_map_1000():
+    return HashTrieMap({x: x for x in range(1000)})
 
 
-def test_same_hash_when_content_the_same_but_underlying_vector_size_differs():
-    x = HashTrieMap({x: x for x in range(1000)})
+def test_same_hash_when_content_the_same_but_underlying_vector_size_differs(
+    big_int_map_1000,
+):
+    x = big_int_map_1000
     y = HashTrieMap({10: 10, 200: 200, 700: 700})
 
     for z in x:
@@ -175,7 +206,10 @@ def test_same_hash_when_content_the_same_but_underlying_vector_size_differs():
 
 
 class HashabilityControlled:
-    hashable = True
+    __slots__ = ("hashable",)
+
+    def __init__(self):
+        self.hashable = True
 
     def __hash__(self):
         if self.hashable:
@@ -192,54 +226,91 @@ def test_map_does_not_hash_values_on_second_hash_invocation():
     hash(x)
 
 
-def test_equal():
-    x = HashTrieMap(a=1, b=2, c=3)
-    y = HashTrieMap(a=1, b=2, c=3)
-
-    assert x == y
-    assert not (x != y)
-
-    assert y == x
-    assert not (y != x)
-
-
-def test_equal_with_different_insertion_order():
-    x = HashTrieMap([(i, i) for i in range(50)])
-    y = HashTrieMap([(i, i) for i in range(49, -1, -1)])
-
-    assert x == y
-    assert not (x != y)
-
-    assert y == x
-    assert not (y != x)
-
-
-def test_not_equal():
-    x = HashTrieMap(a=1, b=2, c=3)
-    y = HashTrieMap(a=1, b=2)
-
-    assert x != y
-    assert not (x == y)
+_O = object()
 
-    assert y != x
-    assert not (y == x)
 
+@pytest.mark.parametrize(
+    "a, b, eq",
+    [
+        pytest.param(
+            lambda: _ABC,
+            lambda: HashTrieMap(a=1, b=2, c=3),
+            True,
+            id="equal",
+        ),
+        pytest.param(
+            lambda: HashTrieMap([(i, i) for i in range(50)]),
+            lambda: HashTrieMap([(i, i) for i in range(49, -1, -1)]),
+            True,
+            id="different-insertion-order",
+        ),
+        pytest.param(lambda: _ABC, lambda: _AB, False, id="not-equal"),
+        pytest.param(
+            lambda: _ABC,
+            lambda: dict(a=1, b=2, d=4),
+            False,
+            id="not-equal-to-dict",
+        ),
+        # Non-pyrsistent-test-suite cases
+        pytest.param(
+            lambda: HashTrieMap([(_O, _O), (1, _O)]),
+            lambda: HashTrieMap([(_O, _O), (1, _O)]),
+            True,
+            id="same-object-keys-and-values",
+        ),
+        pytest.param(
+            lambda: HashTrieMap([(_O, "foo")]),
+            lambda: HashTrieMap([(_O, "foo")]),
+            True,
+            id="same-object-keys",
+        ),
+        pytest.param(
+            lambda: _EMPTY,
+            lambda: HashTrieMap([]),
+            True,
+            id="empty",
+            marks=pytest.mark.xfail(strict=True, reason=NE_MSG),
+        ),
+        pytest.param(
+            lambda: HashTrieMap({1: 2}),
+            lambda: HashTrieMap({1: 3}),
+            False,
+            id="different-values",
+        ),
+        pytest.param(
+            lambda: HashTrieMap({_O: 1}),
+            lambda: HashTrieMap({_O: _O}),
+            False,
+            id="different-object-values",
+        ),
+        pytest.param(
+            lambda: HashTrieMap([]),
+            lambda: HashTrieMap([(_O, 1)]),
+            False,
+            id="empty-and-nonempty",
+        ),
+        pytest.param(
+            lambda: _AB,
+            lambda: HashTrieMap(a=1, b=3),
+            False,
+            id="same-size-some-values-differ",
+            marks=pytest.mark.xfail(strict=True, reason=NE_MSG),
+        ),
+    ],
+)
+def test_equality(a, b, eq):
+    x, y = a(), b()
 
-def test_not_equal_to_dict():
-    x = HashTrieMap(a=1, b=2, c=3)
-    y = dict(a=1, b=2, d=4)
-
-    assert x != y
-    assert not (x == y)
+    assert (x == y) is eq
+    assert (x != y) is (not eq)
 
-    assert y != x
-    assert not (y == x)
+    assert (y == x) is eq
+    assert (y != x) is (not eq)
 
 
 def test_update_with_multiple_arguments():
     # If same value is present in multiple sources, the rightmost is used.
-    x = HashTrieMap(a=1, b=2, c=3)
-    y = x.update(HashTrieMap(b=4, c=5), {"c": 6})
+    y = _ABC.update(HashTrieMap(b=4, c=5), {"c": 6})
 
     assert y == HashTrieMap(a=1, b=4, c=6)
 
@@ -247,7 +318,7 @@ def test_update_with_multiple_arguments():
 def test_update_one_argument():
     x = HashTrieMap(a=1)
 
-    assert x.update({"b": 2}) == HashTrieMap(a=1, b=2)
+    assert x.update({"b": 2}) == _AB
 
 
 def test_update_no_arguments():
@@ -257,6 +328,8 @@ def test_update_no_arguments():
 
 
 class HashDummy:
+    __slots__ = ()
+
     def __hash__(self):
         return 6528039219058920  # Hash of '33'
 
@@ -264,19 +337,27 @@ class HashDummy:
         return self is other
 
 
-def test_iteration_with_many_elements():
-    values = list(range(2000))
-    keys = [str(x) for x in values]
-    init_dict = dict(zip(keys, values))
+@pytest.fixture(scope="session")
+def hash_dummies():
+    return HashDummy(), HashDummy()
 
-    hash_dummy1 = HashDummy()
-    hash_dummy2 = HashDummy()
 
+@pytest.fixture(scope="session")
+def big_map_2000_with_collisions(base_dict_2000, hash_dummies):
     # Throw in a couple of hash collision nodes to tests
     # those properly as well
-    init_dict[hash_dummy1] = 12345
-    init_dict[hash_dummy2] = 54321
-    a_map = HashTrieMap(init_dict)
+    hash_dummy1, hash_dummy2 = hash_dummies
+    return HashTrieMap(
+        {**base_dict_2000, hash_dummy1: 12345, hash_dummy2: 54321},
+    )
+
+
+def test_iteration_with_many_elements(
+    big_map_2000_with_collisions,
+    hash_dummies,
+):
+    hash_dummy1, hash_dummy2 = hash_dummies
+    a_map = big_map_2000_with_collisions
 
     actual_values = set()
     actual_keys = set()
@@ -285,8 +366,8 @@ def test_iteration_with_many_elements():
         actual_values.add(v)
         actual_keys.add(k)
 
-    assert actual_keys == {*keys, hash_dummy1, hash_dummy2}
-    assert actual_values == {*values, 12345, 54321}
+    assert actual_keys == {*_KEYS_2000, hash_dummy1, hash_dummy2}
+    assert actual_values == {*range(2000), 12345, 54321}
 
 
 def test_repr():
@@ -325,22 +406,8 @@ def test_fast_convert_hashtriemap():
 # Non-pyrsistent-test-suite tests
 
 
-def test_more_eq():
-    o = object()
-
-    assert HashTrieMap([(o, o), (1, o)]) == HashTrieMap([(o, o), (1, o)])
-    assert HashTrieMap([(o, "foo")]) == HashTrieMap([(o, "foo")])
-    assert HashTrieMap() == HashTrieMap([])
-
-    assert HashTrieMap({1: 2}) != HashTrieMap({1: 3})
-    assert HashTrieMap({o: 1}) != HashTrieMap({o: o})
-    assert HashTrieMap([]) != HashTrieMap([(o, 1)])
-
-
 def test_pickle():
-    assert pickle.loads(
-        pickle.dumps(HashTrieMap([(1, 2), (3, 4)])),
-    ) == HashTrieMap([(1, 2), (3, 4)])
+    assert pickle.loads(_PICKLED_12_34) == HashTrieMap([(1, 2), (3, 4)])
 
 
 def test_get():
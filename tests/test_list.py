@@ -102,8 +102,10 @@ def test_repr():
 
 @pytest.mark.xfail(reason=HASH_MSG)
 def test_hashing():
-    assert hash(List([1, 2])) == hash(List([1, 2]))
-    assert hash(List([1, 2])) != hash(List([2, 1]))
+    hashed = hash(List([1, 2]))
+
+    assert hashed == hash(List([1, 2]))
+    assert hashed != hash(List([2, 1]))
 
 
 def test_sequence():
@@ -129,19 +131,24 @@ def test_drop_first_empty():
 def test_more_eq():
     o = object()
 
-    assert List([o, o]) == List([o, o])
-    assert List([o]) == List([o])
-    assert List() == List([])
-    assert not (List([1, 2]) == List([1, 3]))
-    assert not (List([o]) == List([o, o]))
-    assert not (List([]) == List([o]))
-
-    assert List([1, 2]) != List([1, 3])
-    assert List([o]) != List([o, o])
-    assert List([]) != List([o])
-    assert not (List([o, o]) != List([o, o]))
-    assert not (List([o]) != List([o]))
-    assert not (List() != List([]))
+    oo, oo_again = List([o, o]), List([o, o])
+    just_o, just_o_again = List([o]), List([o])
+    empty, empty_from_list = List(), List([])
+    one_two, one_three = List([1, 2]), List([1, 3])
+
+    assert oo == oo_again
+    assert just_o == just_o_again
+    assert empty == empty_from_list
+    assert not (one_two == one_three)
+    assert not (just_o == oo)
+    assert not (empty_from_list == just_o)
+
+    assert one_two != one_three
+    assert just_o != oo
+    assert empty_from_list != just_o
+    assert not (oo != oo_again)
+    assert not (just_o != just_o_again)
+    assert not (empty != empty_from_list)
 
 
 def test_pickle():